@@ -1,41 +1,154 @@
-import sys
 import os
-from typing import List, Optional
-from fastapi import FastAPI, HTTPException, Body
+from typing import Annotated, Any, Dict, List, Tuple, Union
+import msgspec
+import orjson
+from fastapi import FastAPI, HTTPException, Body, Depends, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field
 
-# --- Import Path Configuration ---
-# Add project root to path so we can import the src package
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# --- Core Modules ---
+# The vijay_toolkit package is importable once the project is installed (pip install -e .).
+from vijay_toolkit.student_manager import StudentManager, Student
+from vijay_toolkit.classroom_tools import ClassroomTools
 
-from src.student_manager import StudentManager
-from src.classroom_tools import ClassroomTools
+# --- Request Models ---
+# Request bodies are decoded and validated by msgspec in a single C pass.
 
-# --- Pydantic Models ---
-
-class StudentCreate(BaseModel):
+class StudentCreate(msgspec.Struct):
     """Schema for adding a new student."""
-    name: str = Field(..., min_length=1, description="Name of the student")
-    section_id: str = Field(..., min_length=1, description="ID of the section the student belongs to")
+    name: Annotated[str, msgspec.Meta(min_length=1, description="Name of the student")]
+    section_id: Annotated[str, msgspec.Meta(min_length=1, description="ID of the section the student belongs to")]
 
-class GroupRequest(BaseModel):
+class GroupRequest(msgspec.Struct):
     """Schema for requesting group creation."""
-    section_id: str = Field(..., description="The section ID to group")
-    group_size: int = Field(..., gt=1, description="Target size for each group")
+    section_id: Annotated[str, msgspec.Meta(description="The section ID to group")]
+    group_size: Annotated[int, msgspec.Meta(gt=1, description="Target size for each group")]
+
+def _request_body_schema(struct_type: type) -> dict:
+    """OpenAPI requestBody for a msgspec Struct, which FastAPI cannot introspect."""
+    schema = msgspec.json.schema(struct_type)["$defs"][struct_type.__name__]
+    return {"requestBody": {"required": True, "content": {"application/json": {"schema": schema}}}}
+
+# strict=False keeps the coercions clients relied on under Pydantic, such as
+# "3" or 3.0 for an int field
+_student_create_decoder = msgspec.json.Decoder(StudentCreate, strict=False)
+_group_request_decoder = msgspec.json.Decoder(GroupRequest, strict=False)
+
+def _request_validation_error(struct_type: type, body: bytes) -> RequestValidationError:
+    """
+    Rebuilds a rejected body's errors in FastAPI's 422 format, a list of
+    {type, loc, msg, input} objects, so body errors look like path and query
+    ones. msgspec only reports a message, so each field is re-checked on its
+    own to recover its location and input.
+    """
+    try:
+        raw = msgspec.json.decode(body)
+    except msgspec.DecodeError as e:
+        return RequestValidationError([{"type": "json_invalid", "loc": ("body",), "msg": str(e), "input": None}])
+    if not isinstance(raw, dict):
+        return RequestValidationError(
+            [{"type": "value_error", "loc": ("body",), "msg": "Expected `object`", "input": raw}]
+        )
+
+    errors: List[Dict[str, Any]] = []
+    for field in msgspec.structs.fields(struct_type):
+        loc = ("body", field.encode_name)
+        if field.encode_name not in raw:
+            if field.required:
+                errors.append({"type": "missing", "loc": loc, "msg": "Field required", "input": raw})
+            continue
+        try:
+            msgspec.convert(raw[field.encode_name], field.type, strict=False)
+        except msgspec.ValidationError as e:
+            errors.append({"type": "value_error", "loc": loc, "msg": str(e), "input": raw[field.encode_name]})
+    if not errors:
+        errors.append({"type": "value_error", "loc": ("body",), "msg": "Invalid request body", "input": raw})
+    return RequestValidationError(errors)
+
+async def parse_student_create(request: Request) -> StudentCreate:
+    """Dependency decoding the request body into a StudentCreate."""
+    body = await request.body()
+    try:
+        return _student_create_decoder.decode(body)
+    except msgspec.DecodeError as e:
+        raise _request_validation_error(StudentCreate, body) from e
+
+async def parse_group_request(request: Request) -> GroupRequest:
+    """Dependency decoding the request body into a GroupRequest."""
+    body = await request.body()
+    try:
+        return _group_request_decoder.decode(body)
+    except msgspec.DecodeError as e:
+        raise _request_validation_error(GroupRequest, body) from e
+
+# --- Response Models ---
 
 class StudentResponse(BaseModel):
-    """Schema for student output."""
+    """
+    Schema for student output.
+    Only documents the OpenAPI schema; responses are encoded by ORJSONResponse.
+    """
     id: str
     name: str
     section_id: str
 
+
+class ValidationError(BaseModel):
+    """One entry of a 422 response, mirroring FastAPI's own schema of that name."""
+    loc: List[Union[str, int]] = Field(title="Location")
+    msg: str = Field(title="Message")
+    type: str = Field(title="Error Type")
+    input: Any = Field(default=None, title="Input")
+    ctx: Dict[str, Any] = Field(default_factory=dict, title="Context")
+
+class HTTPValidationError(BaseModel):
+    """
+    Schema for 422 responses.
+    Declared explicitly on routes whose bodies are decoded by msgspec, since
+    FastAPI only adds it for parameters it validates itself.
+    """
+    detail: List[ValidationError]
+
+_VALIDATION_ERROR_RESPONSE: Dict[Union[int, str], Dict[str, Any]] = {
+    422: {"model": HTTPValidationError, "description": "Validation Error"}
+}
+
+# --- Response Class ---
+
+def _encode_student(obj: Any) -> Any:
+    """orjson fallback hook mapping Student records onto the StudentResponse shape."""
+    if isinstance(obj, Student):
+        return obj.response_dict
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _dumps(content: Any) -> bytes:
+    """Encodes content with orjson, emitting Students via _encode_student."""
+    return orjson.dumps(
+        content,
+        default=_encode_student,
+        option=orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson's C encoder instead of stdlib json.
+    Student dataclasses are passed through to _encode_student so they are
+    emitted from their prebuilt response dicts without any per-request work.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
 # --- App Initialization ---
 
 app = FastAPI(
     title="Vijay's Classroom Toolkit API",
     description="Backend API for managing students, sections, and classroom utilities.",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # --- CORS Configuration ---
@@ -55,6 +168,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# --- Compression ---
+# Roster and group responses are repetitive JSON and compress well. Small
+# payloads such as /spin stay under minimum_size and are sent uncompressed.
+
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # --- Dependency Injection / State Management ---
 
 # Initialize core business logic modules
@@ -62,80 +181,128 @@ app.add_middleware(
 student_manager = StudentManager()
 classroom_tools = ClassroomTools(student_manager)
 
+# Declared async so FastAPI resolves them inline instead of in the threadpool
+async def get_manager() -> StudentManager:
+    """Dependency providing the shared StudentManager."""
+    return student_manager
+
+async def get_tools() -> ClassroomTools:
+    """Dependency providing the shared ClassroomTools."""
+    return classroom_tools
+
+# --- Roster Cache ---
+# Section rosters are kept as already-serialized JSON, tagged with the roster
+# version they were encoded from, so repeat reads skip encoding entirely. A
+# write bumps the section's version and the next read re-encodes it in place.
+
+_roster_body_cache: Dict[str, Tuple[int, bytes]] = {}
+
 # --- Endpoints ---
+# Endpoints returning students hand Student records straight to ORJSONResponse.
+# Returning a Response skips FastAPI's validation and jsonable_encoder passes,
+# so response_model only documents the output shape in the OpenAPI schema.
 
 @app.get("/")
 async def root():
     """Health check endpoint."""
     return {"message": "Vijay's Classroom Toolkit API is running"}
 
-@app.post("/students", response_model=StudentResponse, status_code=201)
-async def add_student(student: StudentCreate):
+@app.post(
+    "/students",
+    response_model=StudentResponse,
+    status_code=201,
+    responses=_VALIDATION_ERROR_RESPONSE,
+    openapi_extra=_request_body_schema(StudentCreate)
+)
+async def add_student(
+    student: StudentCreate = Depends(parse_student_create),
+    manager: StudentManager = Depends(get_manager)
+) -> ORJSONResponse:
     """
     Add a student to a specific section.
     Delegates to StudentManager.
     """
     try:
         # Assuming student_manager.add_student returns the created student dict or object
-        new_student = student_manager.add_student(student.name, student.section_id)
-        return {
-            "id": new_student.student_id,
-            "name": new_student.name,
-            "section_id": new_student.section_id
-        }
+        new_student = manager.add_student(student.name, student.section_id)
+        return ORJSONResponse(new_student, status_code=201)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal Server Error: {str(e)}")
 
 @app.get("/sections/{section_id}", response_model=List[StudentResponse])
-async def get_section_students(section_id: str):
+async def get_section_students(
+    section_id: str,
+    manager: StudentManager = Depends(get_manager)
+) -> Response:
     """
     Retrieve all students in a specific section.
+    Served from the roster cache when available.
     """
-    try:
-        students = student_manager.get_students_by_section(section_id)
-        return [
-            {
-                "id": s.student_id,
-                "name": s.name,
-                "section_id": s.section_id
-            } for s in students
-        ]
-    except Exception as e:
-        # If section not found, return empty list
-        return []
+    # If section not found, return empty list
+    if not manager.has_section(section_id):
+        return ORJSONResponse([])
+
+    version = manager.get_section_version(section_id)
+    cached = _roster_body_cache.get(section_id)
+    if cached is None or cached[0] != version:
+        cached = (version, _dumps(manager.get_roster_snapshot(section_id)))
+        _roster_body_cache[section_id] = cached
+    return Response(content=cached[1], media_type="application/json")
 
 @app.post("/spin/{section_id}", response_model=StudentResponse)
-async def spin_wheel(section_id: str):
+async def spin_wheel(
+    section_id: str,
+    tools: ClassroomTools = Depends(get_tools)
+) -> ORJSONResponse:
     """
     Randomly select a student from a section.
     Delegates to ClassroomTools.
     """
     try:
-        selected_student = classroom_tools.spin_wheel(section_id)
+        selected_student = tools.spin_wheel(section_id)
         if not selected_student:
             raise HTTPException(status_code=404, detail="No students found in this section to select from.")
-        return selected_student
+        return ORJSONResponse(selected_student)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@app.post("/groups", response_model=List[List[StudentResponse]])
-async def create_groups(request: GroupRequest):
+@app.post(
+    "/groups",
+    response_model=List[List[StudentResponse]],
+    responses=_VALIDATION_ERROR_RESPONSE,
+    openapi_extra=_request_body_schema(GroupRequest)
+)
+async def create_groups(
+    request: GroupRequest = Depends(parse_group_request),
+    tools: ClassroomTools = Depends(get_tools)
+) -> ORJSONResponse:
     """
     Create random groups of students from a section.
     Delegates to ClassroomTools.
     """
     try:
-        groups = classroom_tools.create_groups(request.section_id, request.group_size)
-        if not groups:
-             raise HTTPException(status_code=404, detail="Not enough students to form groups.")
-        return groups
+        groups = tools.create_groups(request.section_id, request.group_size)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    if not groups:
+        raise HTTPException(status_code=404, detail="Not enough students to form groups.")
+    return ORJSONResponse(groups)
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # uvicorn picks uvloop and httptools automatically when uvicorn[standard]
+    # installed them. Rosters live in this process's StudentManager, so the
+    # server runs a single worker by default: separate workers would each hold
+    # their own roster. Only raise CLASSROOM_TOOLKIT_WORKERS once state has
+    # moved to an external store.
+    uvicorn.run(
+        "backend.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.environ.get("CLASSROOM_TOOLKIT_WORKERS", "1")),
+    )
@@ -0,0 +1,14 @@
+import os
+
+from setuptools import setup
+
+# Optional mypyc build of the core modules. Compile with:
+#   pip install mypy
+#   CLASSROOM_TOOLKIT_USE_MYPYC=1 pip install --no-build-isolation .
+ext_modules = []
+if os.environ.get("CLASSROOM_TOOLKIT_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["src/vijay_toolkit/student_manager.py", "src/vijay_toolkit/classroom_tools.py"])
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,82 @@
+import random
+import math
+from typing import List, Optional
+from .student_manager import StudentManager, Student
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:  # numpy is optional; shuffles fall back to random.sample
+    HAS_NUMPY = False
+
+# Sections at least this large are shuffled with numpy when it is installed;
+# below it numpy's call overhead outweighs the faster permutation.
+NUMPY_SHUFFLE_THRESHOLD = 200
+
+class ClassroomTools:
+    def __init__(self, student_manager: StudentManager, rng: Optional[random.Random] = None) -> None:
+        """
+        Args:
+            student_manager (StudentManager): Source of section rosters.
+            rng (Optional[random.Random]): Generator used for spins and shuffles.
+                Pass a seeded instance for reproducible results; defaults to a
+                fresh OS-seeded generator.
+        """
+        self.student_manager = student_manager
+        self.rng = rng if rng is not None else random.Random()
+
+    def spin_wheel(self, section_id: str) -> Optional[Student]:
+        """
+        Randomly selects a single student from a specific section.
+
+        Args:
+            section_id (str): The unique identifier for the discussion section.
+
+        Returns:
+            Optional[Student]: The selected student, or None if the section is empty
+                               or does not exist.
+        """
+        if not self.student_manager.has_section(section_id):
+            return None
+
+        return self.student_manager.random_student_in_section(section_id, self.rng)
+
+    def create_groups(self, section_id: str, group_size: int) -> List[List[Student]]:
+        """
+        Creates groups of a specific size from the students in a section.
+        The final group may contain fewer students than the specified group_size.
+
+        Args:
+            section_id (str): The unique identifier for the discussion section.
+            group_size (int): The target number of students per group.
+
+        Returns:
+            List[List[Student]]: A list of groups, where each group is a list of students.
+                                 Returns an empty list if no students are found.
+        
+        Raises:
+            ValueError: If group_size is less than 1.
+        """
+        if group_size < 1:
+            raise ValueError("Group size must be at least 1.")
+
+        if not self.student_manager.has_section(section_id):
+            return []
+
+        students = self.student_manager.get_roster_snapshot(section_id)
+        if not students:
+            return []
+
+        # Shuffle to ensure randomness
+        if HAS_NUMPY and len(students) >= NUMPY_SHUFFLE_THRESHOLD:
+            # Permute indices in C, then gather the students by position
+            order = np.random.default_rng(self.rng.getrandbits(64)).permutation(len(students)).tolist()
+            shuffled_students = [students[i] for i in order]
+        else:
+            # sample() returns a new shuffled list in one call
+            shuffled_students = self.rng.sample(students, k=len(students))
+
+        return [
+            shuffled_students[i : i + group_size]
+            for i in range(0, len(shuffled_students), group_size)
+        ]
\ No newline at end of file
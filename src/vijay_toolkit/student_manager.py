@@ -0,0 +1,507 @@
+import base64
+import csv
+import io
+import os
+import random
+from operator import itemgetter
+from dataclasses import dataclass, field
+from typing import FrozenSet, Iterable, List, Dict, Mapping, Optional, Sequence, Tuple
+
+# Columns a roster CSV must provide, in the order they are read from each row
+_ROSTER_CSV_COLUMNS = ('section_id', 'section_name', 'student_id', 'student_name')
+_REQUIRED_FIELDS = frozenset(_ROSTER_CSV_COLUMNS)
+
+class StudentManagerError(Exception):
+    """Base exception for student manager errors."""
+    pass
+
+class DuplicateStudentIdError(StudentManagerError):
+    """Raised when attempting to add a student with an existing ID."""
+    pass
+
+class SectionNotFoundError(StudentManagerError):
+    """Raised when an operation is requested for a non-existent section."""
+    pass
+
+class StudentNotFoundError(StudentManagerError):
+    """Raised when an operation is requested for a non-existent student."""
+    pass
+
+@dataclass(slots=True)
+class Student:
+    """
+    Represents a student entity.
+
+    Change a student's fields through StudentManager.update_student rather than
+    by assignment: the manager keeps response_dict and the section rosters in
+    step with them.
+    
+    Attributes:
+        name (str): The full name of the student.
+        student_id (str): Unique identifier for the student.
+        section_id (str): The ID of the section the student belongs to.
+    """
+    name: str
+    student_id: str
+    section_id: str
+    _cached_resp: Dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._refresh_cached_resp()
+
+    @property
+    def response_dict(self) -> Mapping[str, str]:
+        """Prebuilt API representation of the student. Do not mutate it."""
+        return self._cached_resp
+
+    def _refresh_cached_resp(self) -> None:
+        self._cached_resp = {"id": self.student_id, "name": self.name, "section_id": self.section_id}
+
+@dataclass(slots=True)
+class Section:
+    """
+    Represents a classroom section.
+    
+    Attributes:
+        section_id (str): Unique identifier for the section.
+        name (str): Human-readable name of the section (e.g., "Math 101").
+    """
+    section_id: str
+    name: str
+
+class StudentManager:
+    """
+    Manages students and sections within a school system.
+    
+    This class serves as the central repository for student and section data.
+    It enforces constraints such as unique student IDs and ensures referential
+    integrity between students and sections.
+    """
+
+    def __init__(self) -> None:
+        # Storage: section_id -> Section object
+        self._sections: Dict[str, Section] = {}
+        # Storage: student_id -> Student object
+        self._students: Dict[str, Student] = {}
+        # Roster: section_id -> dense list of the section's Student objects
+        self._section_roster: Dict[str, List[Student]] = {}
+        # Index: student_id -> position in its section's roster, for O(1) removal
+        self._section_roster_pos: Dict[str, int] = {}
+        # Version: section_id -> counter bumped whenever the section's roster changes
+        self._section_version: Dict[str, int] = {}
+        # Cache: section_id -> (version, snapshot of the section's students)
+        self._section_list_cache: Dict[str, Tuple[int, Tuple[Student, ...]]] = {}
+        # Cache: section_id -> (version, frozenset of the section's student IDs)
+        self._section_ids_cache: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+        # ID generation: random per-manager prefix plus a counter, so auto IDs
+        # stay unique across restarts without a urandom syscall per student
+        self._id_prefix: str = base64.b32encode(os.urandom(5)).decode().lower()
+        self._next_id: int = 0
+
+    def add_section(self, section_id: str, name: str) -> Section:
+        """
+        Creates and adds a new section to the manager.
+
+        Args:
+            section_id (str): Unique ID for the section.
+            name (str): Name of the section.
+
+        Returns:
+            Section: The created section object.
+        """
+        if section_id in self._sections:
+            # Idempotent update or raise error? Choosing update for simplicity here,
+            # but in strict systems, this might raise an error.
+            self._sections[section_id].name = name
+        else:
+            self._sections[section_id] = Section(section_id=section_id, name=name)
+            self._section_roster[section_id] = []
+            self._section_version[section_id] = 0
+        
+        return self._sections[section_id]
+
+    def _bump_section_version(self, section_id: str) -> None:
+        """Invalidates the cached roster snapshot for a section."""
+        self._section_version[section_id] = self._section_version.get(section_id, 0) + 1
+
+    def _roster_append(self, student: Student) -> None:
+        """Appends a student to the end of its section's roster."""
+        roster = self._section_roster[student.section_id]
+        self._section_roster_pos[student.student_id] = len(roster)
+        roster.append(student)
+        self._bump_section_version(student.section_id)
+
+    def _roster_remove(self, student: Student) -> None:
+        """Removes a student from its section's roster by swapping in the last entry."""
+        roster = self._section_roster[student.section_id]
+        pos = self._section_roster_pos.pop(student.student_id)
+        last = roster.pop()
+        if last is not student:
+            roster[pos] = last
+            self._section_roster_pos[last.student_id] = pos
+        self._bump_section_version(student.section_id)
+
+    def _generate_student_id(self) -> str:
+        """Returns the next unused auto-generated student ID."""
+        while True:
+            self._next_id += 1
+            student_id = f"{self._id_prefix}-{self._next_id:x}"
+            if student_id not in self._students:
+                return student_id
+
+    def has_section(self, section_id: str) -> bool:
+        """Checks whether a section exists."""
+        return section_id in self._sections
+
+    def get_section(self, section_id: str) -> Optional[Section]:
+        """Retrieves a section by ID."""
+        return self._sections.get(section_id)
+
+    def get_section_version(self, section_id: str) -> int:
+        """
+        Returns a counter that changes whenever the section's students change.
+
+        Raises:
+            SectionNotFoundError: If the section does not exist.
+        """
+        if section_id not in self._sections:
+            raise SectionNotFoundError(f"Section ID {section_id} not found.")
+        return self._section_version[section_id]
+
+    def add_student(self, name: str, section_id: str, student_id: Optional[str] = None) -> Student:
+        """
+        Adds a new student to the system.
+
+        Args:
+            name (str): Student's name.
+            section_id (str): ID of the section to assign.
+            student_id (Optional[str]): Unique student ID. If not provided, auto-generated.
+
+        Returns:
+            Student: The created student object.
+
+        Raises:
+            DuplicateStudentIdError: If student_id already exists.
+            SectionNotFoundError: If section_id does not exist.
+        """
+        if student_id is None:
+            student_id = self._generate_student_id()
+        
+        if student_id in self._students:
+            raise DuplicateStudentIdError(f"Student ID {student_id} already exists.")
+        
+        # Create section if it doesn't exist
+        if section_id not in self._sections:
+            self.add_section(section_id, section_id)  # Use section_id as name for simplicity
+
+        new_student = Student(name=name, student_id=student_id, section_id=section_id)
+        
+        self._students[student_id] = new_student
+        self._roster_append(new_student)
+        
+        return new_student
+
+    def add_students(self, section_id: str, students: Iterable[Tuple[str, str]]) -> List[Student]:
+        """
+        Adds several students to one section in a single batch.
+
+        The batch is validated up front, so either every student is added or
+        none are.
+
+        Args:
+            section_id (str): ID of the section to assign.
+            students (Iterable[Tuple[str, str]]): (name, student_id) pairs.
+
+        Returns:
+            List[Student]: The created student objects, in input order.
+
+        Raises:
+            DuplicateStudentIdError: If a student_id already exists or repeats within the batch.
+        """
+        new_students = [
+            Student(name=name, student_id=student_id, section_id=section_id)
+            for name, student_id in students
+        ]
+        new_ids = {s.student_id for s in new_students}
+        if len(new_ids) != len(new_students):
+            raise DuplicateStudentIdError("Student IDs repeat within the batch.")
+
+        duplicate_ids = self._students.keys() & new_ids
+        if duplicate_ids:
+            raise DuplicateStudentIdError(f"Student IDs {sorted(duplicate_ids)} already exist.")
+
+        # Create section if it doesn't exist
+        if section_id not in self._sections:
+            self.add_section(section_id, section_id)
+
+        roster = self._section_roster[section_id]
+        start = len(roster)
+        roster.extend(new_students)
+        self._students.update((s.student_id, s) for s in new_students)
+        self._section_roster_pos.update(
+            (s.student_id, start + i) for i, s in enumerate(new_students)
+        )
+        if new_students:
+            self._bump_section_version(section_id)
+
+        return new_students
+
+    def remove_student(self, student_id: str) -> None:
+        """
+        Removes a student from the system.
+
+        Args:
+            student_id (str): The ID of the student to remove.
+
+        Raises:
+            StudentNotFoundError: If the student does not exist.
+        """
+        if student_id not in self._students:
+            raise StudentNotFoundError(f"Student ID {student_id} not found.")
+
+        student = self._students[student_id]
+        
+        # Clean up roster
+        self._roster_remove(student)
+        
+        # Remove record
+        del self._students[student_id]
+
+    def update_student(self, student_id: str, name: Optional[str] = None, section_id: Optional[str] = None) -> Student:
+        """
+        Updates an existing student's details.
+
+        Args:
+            student_id (str): The ID of the student to update.
+            name (Optional[str]): New name (if changing).
+            section_id (Optional[str]): New section ID (if changing).
+
+        Returns:
+            Student: The updated student object.
+
+        Raises:
+            StudentNotFoundError: If the student does not exist.
+            SectionNotFoundError: If the new section_id does not exist.
+        """
+        if student_id not in self._students:
+            raise StudentNotFoundError(f"Student ID {student_id} not found.")
+
+        if section_id is not None and section_id not in self._sections:
+            raise SectionNotFoundError(f"Target Section ID {section_id} not found.")
+
+        student = self._students[student_id]
+
+        if name is not None and name != student.name:
+            student.name = name
+            # The snapshot holds the same objects, but serialized copies of the
+            # roster keyed on the version must not outlive a rename
+            self._bump_section_version(student.section_id)
+
+        if section_id is not None and section_id != student.section_id:
+            # Remove from old section roster
+            self._roster_remove(student)
+            
+            # Update student record
+            student.section_id = section_id
+            
+            # Add to new section roster
+            self._roster_append(student)
+
+        student._refresh_cached_resp()
+        return student
+
+    def get_roster_snapshot(self, section_id: str) -> Tuple[Student, ...]:
+        """
+        Retrieves an immutable snapshot of the students in a section.
+
+        The snapshot is memoized per section and only rebuilt after the section's
+        version is bumped by add_student, remove_student or update_student, so
+        repeated reads are O(1).
+
+        Args:
+            section_id (str): The section ID to filter by.
+
+        Returns:
+            Tuple[Student, ...]: The section's students.
+
+        Raises:
+            SectionNotFoundError: If the section does not exist.
+        """
+        if section_id not in self._sections:
+            raise SectionNotFoundError(f"Section ID {section_id} not found.")
+
+        version = self._section_version[section_id]
+        cached = self._section_list_cache.get(section_id)
+        if cached is None or cached[0] != version:
+            cached = (version, tuple(self._section_roster[section_id]))
+            self._section_list_cache[section_id] = cached
+
+        return cached[1]
+
+    def get_students_by_section(self, section_id: str) -> List[Student]:
+        """
+        Retrieves all students belonging to a specific section.
+
+        Args:
+            section_id (str): The section ID to filter by.
+
+        Returns:
+            List[Student]: A list of Student objects the caller is free to modify.
+
+        Raises:
+            SectionNotFoundError: If the section does not exist.
+        """
+        return list(self.get_roster_snapshot(section_id))
+
+    def get_student_ids_by_section(self, section_id: str) -> FrozenSet[str]:
+        """
+        Retrieves the IDs of all students in a section for O(1) membership tests.
+
+        Memoized per section version, like get_roster_snapshot.
+
+        Args:
+            section_id (str): The section ID to filter by.
+
+        Returns:
+            FrozenSet[str]: The section's student IDs.
+
+        Raises:
+            SectionNotFoundError: If the section does not exist.
+        """
+        if section_id not in self._sections:
+            raise SectionNotFoundError(f"Section ID {section_id} not found.")
+
+        version = self._section_version[section_id]
+        cached = self._section_ids_cache.get(section_id)
+        if cached is None or cached[0] != version:
+            ids = frozenset(s.student_id for s in self._section_roster[section_id])
+            cached = (version, ids)
+            self._section_ids_cache[section_id] = cached
+
+        return cached[1]
+
+    def random_student_in_section(
+        self, section_id: str, rng: Optional[random.Random] = None
+    ) -> Optional[Student]:
+        """
+        Picks a random student from a section without copying its roster.
+
+        Args:
+            section_id (str): The section ID to pick from.
+            rng (Optional[random.Random]): Generator to draw from. Defaults to the
+                random module's shared generator.
+
+        Returns:
+            Optional[Student]: The selected student, or None if the section is empty.
+
+        Raises:
+            SectionNotFoundError: If the section does not exist.
+        """
+        if section_id not in self._sections:
+            raise SectionNotFoundError(f"Section ID {section_id} not found.")
+
+        roster = self._section_roster[section_id]
+        if not roster:
+            return None
+        choice = rng.choice if rng is not None else random.choice
+        return choice(roster)
+
+    def import_roster_from_csv(self, csv_text: str) -> Dict[str, int]:
+        """
+        Imports students and sections from a CSV string.
+        
+        Expected CSV format: section_id, section_name, student_id, student_name
+        
+        This method is upsert-friendly for sections (will create if missing),
+        but strict on duplicate student IDs.
+
+        Args:
+            csv_text (str): The raw CSV content string.
+
+        Returns:
+            Dict[str, int]: Statistics on the import {'students_added': int, 'sections_seen': int}
+
+        Raises:
+            ValueError: If the header lacks a required column, or a row has fewer
+                columns than the header. Rows before a short row have already
+                been imported.
+        """
+        reader = csv.reader(io.StringIO(csv_text))
+        
+        # Normalize headers to lower case strip for robustness
+        fieldnames = tuple(name.strip().lower() for name in next(reader, ()))
+        
+        if not _REQUIRED_FIELDS.issubset(fieldnames):
+            raise ValueError(f"CSV must contain columns: {set(_ROSTER_CSV_COLUMNS)}")
+
+        # Pull the four columns out of each non-blank row in a single C-level call
+        pick_columns = itemgetter(*(fieldnames.index(column) for column in _ROSTER_CSV_COLUMNS))
+        try:
+            return self._import_rows(map(pick_columns, filter(None, reader)))
+        except IndexError as e:
+            raise ValueError(f"CSV row {reader.line_num} has fewer columns than the header.") from e
+
+    def import_roster(self, rows: Iterable[Mapping[str, str]]) -> Dict[str, int]:
+        """
+        Imports students and sections from already-parsed rows, skipping CSV parsing.
+
+        Each row maps section_id, section_name, student_id and student_name to
+        values. Sections and duplicates are handled as in import_roster_from_csv.
+
+        Args:
+            rows (Iterable[Mapping[str, str]]): The roster rows, e.g. dicts.
+
+        Returns:
+            Dict[str, int]: Statistics on the import {'students_added': int, 'sections_seen': int}
+
+        Raises:
+            ValueError: If a row is missing one of the required columns. Rows
+                before it have already been imported.
+        """
+        try:
+            return self._import_rows(map(itemgetter(*_ROSTER_CSV_COLUMNS), rows))
+        except KeyError as e:
+            raise ValueError(f"Roster rows must contain columns: {set(_ROSTER_CSV_COLUMNS)}") from e
+
+    def _import_rows(self, records: Iterable[Sequence[str]]) -> Dict[str, int]:
+        """
+        Shared import core taking (section_id, section_name, student_id, student_name) records.
+        """
+        stats = {'students_added': 0, 'sections_seen': 0}
+        seen_sections = set()
+        changed_sections = set()
+
+        # Bulk path: write straight into the stores instead of going through
+        # add_student per row, and bump each touched section's version once.
+        students = self._students
+        rosters = self._section_roster
+        roster_pos = self._section_roster_pos
+
+        try:
+            for record in records:
+                sec_id, sec_name, stu_id, stu_name = map(str.strip, record)
+
+                # Ensure section exists
+                if sec_id not in self._sections:
+                    self.add_section(sec_id, sec_name)
+                
+                seen_sections.add(sec_id)
+
+                # In a bulk import, we might log this and continue, 
+                # or raise. For this implementation, we skip duplicates.
+                if stu_id in students:
+                    continue
+
+                roster = rosters[sec_id]
+                roster_pos[stu_id] = len(roster)
+                roster.append(Student(name=stu_name, student_id=stu_id, section_id=sec_id))
+                students[stu_id] = roster[-1]
+                changed_sections.add(sec_id)
+                stats['students_added'] += 1
+        finally:
+            # Invalidate even if a malformed record aborts the import part-way
+            for sec_id in changed_sections:
+                self._bump_section_version(sec_id)
+
+        stats['sections_seen'] = len(seen_sections)
+        return stats
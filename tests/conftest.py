@@ -0,0 +1,53 @@
+import os
+import pickle
+
+import pytest
+from vijay_toolkit.student_manager import StudentManager
+
+
+# Options that need .pytest_cache; when any is given the cache stays enabled
+_CACHE_OPTIONS = ("lf", "failedfirst", "newfirst", "stepwise")
+
+
+def pytest_configure(config):
+    """Skip writing .pytest_cache on local runs unless a cache-based option is used."""
+    if os.environ.get("CI"):
+        return
+    if any(config.getoption(name, default=False) for name in _CACHE_OPTIONS):
+        return
+    # cacheprovider registers lfplugin/nfplugin, which do the writes at session end
+    for name in ("cacheprovider", "lfplugin", "nfplugin"):
+        config.pluginmanager.set_blocked(name)
+
+
+def _build_populated_manager():
+    manager = StudentManager()
+    manager.add_section("A", "Section A")
+    manager.add_section("B", "Section B")
+    manager.add_student("Alice", "A", "alice1")
+    manager.add_student("Bob", "A", "bob1")
+    manager.add_student("Charlie", "B", "charlie1")
+    return manager
+
+
+def _build_three_student_manager():
+    manager = StudentManager()
+    manager.add_section("sec1", "Section 1")
+    manager.add_student("Alice", "sec1", "s1")
+    manager.add_student("Bob", "sec1", "s2")
+    manager.add_student("Charlie", "sec1", "s3")
+    return manager
+
+
+# Templates are built once per session and pickled; pickle.loads rebuilds a fresh
+# copy faster than deepcopy, so per-test fixtures just load the blob
+@pytest.fixture(scope="session")
+def populated_template():
+    """Pickled manager with sections A/B and three students."""
+    return pickle.dumps(_build_populated_manager(), protocol=5)
+
+
+@pytest.fixture(scope="session")
+def three_student_template():
+    """Pickled manager with one section sec1 holding s1, s2 and s3."""
+    return pickle.dumps(_build_three_student_manager(), protocol=5)
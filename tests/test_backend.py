@@ -0,0 +1,103 @@
+import pytest
+
+pytest.importorskip("httpx")
+from fastapi.testclient import TestClient
+
+from backend import main
+from vijay_toolkit.classroom_tools import ClassroomTools
+from vijay_toolkit.student_manager import StudentManager
+
+
+@pytest.fixture
+def manager():
+    """Fresh manager with one section, swapped in for the app's shared one."""
+    manager = StudentManager()
+    manager.add_students("sec1", [("Alice", "s1"), ("Bob", "s2")])
+    return manager
+
+
+@pytest.fixture
+def roster_cache(monkeypatch):
+    """Empty roster body cache, so entries from other tests' managers never leak in."""
+    cache = {}
+    monkeypatch.setattr(main, "_roster_body_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def client(manager, roster_cache):
+    """TestClient whose endpoints use the fresh manager."""
+    main.app.dependency_overrides[main.get_manager] = lambda: manager
+    main.app.dependency_overrides[main.get_tools] = lambda: ClassroomTools(manager)
+    try:
+        yield TestClient(main.app)
+    finally:
+        main.app.dependency_overrides.clear()
+
+
+class TestRosterCache:
+    def test_miss_stores_serialized_roster(self, client, roster_cache, manager):
+        """Test that a cache miss stores the response body with its roster version."""
+        response = client.get("/sections/sec1")
+
+        assert [s["id"] for s in response.json()] == ["s1", "s2"]
+        assert roster_cache == {"sec1": (manager.get_section_version("sec1"), response.content)}
+
+    def test_hit_is_served_from_cache(self, client, roster_cache, manager):
+        """Test that a cached body for the current version is returned as is."""
+        roster_cache["sec1"] = (manager.get_section_version("sec1"), b'["cached"]')
+
+        assert client.get("/sections/sec1").json() == ["cached"]
+
+    def test_write_invalidates_cached_roster(self, client, roster_cache):
+        """Test that adding a student is visible despite a cached older roster."""
+        client.get("/sections/sec1")
+        client.post("/students", json={"name": "Carol", "section_id": "sec1"})
+
+        names = [s["name"] for s in client.get("/sections/sec1").json()]
+
+        assert names == ["Alice", "Bob", "Carol"]
+
+    def test_missing_section_is_not_cached(self, client, roster_cache):
+        """Test that unknown sections return an empty list without caching."""
+        assert client.get("/sections/nonexistent").json() == []
+        assert roster_cache == {}
+
+
+class TestRequestValidation:
+    @pytest.mark.parametrize(
+        "path, body, error_type, loc, bad_input",
+        [
+            ("/students", b'{"section_id": "sec1"}', "missing", ["body", "name"], {"section_id": "sec1"}),
+            ("/students", b'{"name": 1, "section_id": "sec1"}', "value_error", ["body", "name"], 1),
+            ("/groups", b'{"section_id": "sec1", "group_size": 1}', "value_error", ["body", "group_size"], 1),
+            ("/groups", b'{"section_id": "sec1", "group_size": 2.5}', "value_error", ["body", "group_size"], 2.5),
+            ("/students", b"not json", "json_invalid", ["body"], None),
+        ],
+        ids=["missing_field", "wrong_type", "constraint", "fractional_int", "malformed_json"],
+    )
+    def test_invalid_body_uses_fastapi_error_list(self, client, path, body, error_type, loc, bad_input):
+        """Test that body errors come back in the same 422 list format as path and query errors."""
+        response = client.post(path, content=body, headers={"content-type": "application/json"})
+
+        assert response.status_code == 422
+        [error] = response.json()["detail"]
+        assert error["type"] == error_type
+        assert error["loc"] == loc
+        assert error["input"] == bad_input
+        assert error["msg"]
+
+    @pytest.mark.parametrize("group_size", ["2", 2.0], ids=["numeric_string", "integral_float"])
+    def test_group_size_is_coerced(self, client, group_size):
+        """Test that lax int inputs are still accepted, as they were under Pydantic."""
+        response = client.post("/groups", json={"section_id": "sec1", "group_size": group_size})
+
+        assert response.status_code == 200
+        assert [len(group) for group in response.json()] == [2]
+
+    @pytest.mark.parametrize("path", ["/students", "/groups"])
+    def test_openapi_documents_422(self, path):
+        """Test that msgspec-decoded routes still document their 422 response."""
+        responses = main.app.openapi()["paths"][path]["post"]["responses"]
+
+        assert "422" in responses
@@ -0,0 +1,37 @@
+import random
+
+import pytest
+from vijay_toolkit.classroom_tools import ClassroomTools
+from vijay_toolkit.student_manager import StudentManager
+
+pytest.importorskip("pytest_benchmark")
+
+# Deselected by default; run with: pytest -m benchmark
+pytestmark = pytest.mark.benchmark
+
+_SIZES = [100, 1000, 10000]
+
+
+def _build_tools(n):
+    manager = StudentManager()
+    manager.add_students("sec", [(f"Student {i}", f"id{i}") for i in range(n)])
+    return ClassroomTools(manager, rng=random.Random(0))
+
+
+@pytest.mark.benchmark(group="create_groups")
+@pytest.mark.parametrize("n", _SIZES)
+def test_perf_create_groups(benchmark, n):
+    """Time create_groups on an n-student section."""
+    tools = _build_tools(n)
+    groups = benchmark(tools.create_groups, "sec", 4)
+
+    assert sum(map(len, groups)) == n
+
+
+@pytest.mark.benchmark(group="spin_wheel")
+@pytest.mark.parametrize("n", _SIZES)
+def test_perf_spin_wheel(benchmark, n):
+    """Time spin_wheel on an n-student section."""
+    tools = _build_tools(n)
+
+    assert benchmark(tools.spin_wheel, "sec") is not None
@@ -1,164 +1,162 @@
+import pickle
+import random
+import re
+from itertools import chain
+from operator import attrgetter
+
 import pytest
-from src.classroom_tools import ClassroomTools
-from src.student_manager import StudentManager
+from vijay_toolkit import classroom_tools as classroom_tools_module
+from vijay_toolkit.classroom_tools import ClassroomTools
+from vijay_toolkit.student_manager import StudentManager, Student
 
 
-@pytest.fixture
-def student_manager():
-    """Create a StudentManager with test data."""
-    manager = StudentManager()
-    manager.add_section("sec1", "Section 1")
-    manager.add_student("Alice", "sec1", "s1")
-    manager.add_student("Bob", "sec1", "s2")
-    manager.add_student("Charlie", "sec1", "s3")
-    return manager
+@pytest.fixture(scope="session")
+def readonly_student_manager(three_student_template):
+    """StudentManager with test data shared by read-only tests. Never mutate it."""
+    return pickle.loads(three_student_template)
 
 
 @pytest.fixture
-def classroom_tools(student_manager):
-    """Create a ClassroomTools instance with the test StudentManager."""
-    return ClassroomTools(student_manager)
+def rng():
+    """Seeded generator so spins and shuffles are deterministic in every test."""
+    return random.Random(0)
 
 
-class TestSpinWheel:
-    def test_spin_wheel_returns_student_from_section(self, classroom_tools):
-        """Test that spin_wheel returns a student dict from the section."""
-        result = classroom_tools.spin_wheel("sec1")
+@pytest.fixture(scope="session")
+def session_classroom_tools(readonly_student_manager):
+    """ClassroomTools shared across the session; only for tests that neither mutate nor draw."""
+    return ClassroomTools(readonly_student_manager, rng=random.Random(0))
 
-        assert result is not None
-        assert "id" in result
-        assert "name" in result
-        assert "section_id" in result
-        assert result["id"] in ["s1", "s2", "s3"]
-        assert result["name"] in ["Alice", "Bob", "Charlie"]
-        assert result["section_id"] == "sec1"
 
-    def test_spin_wheel_single_student(self):
-        """Test spin_wheel with a section containing one student."""
-        manager = StudentManager()
-        manager.add_section("solo", "Solo Section")
-        manager.add_student("Lonely", "solo", "lone1")
-        tools = ClassroomTools(manager)
+@pytest.fixture
+def seeded_classroom_tools(readonly_student_manager, rng):
+    """ClassroomTools over the read-only template with a freshly seeded rng per test."""
+    return ClassroomTools(readonly_student_manager, rng=rng)
 
-        result = tools.spin_wheel("solo")
 
-        assert result is not None
-        assert result["name"] == "Lonely"
-        assert result["id"] == "lone1"
+_INVALID_SIZE_RE = re.compile(r"Group size must be at least 1")
 
-    def test_spin_wheel_empty_section(self):
-        """Test spin_wheel with an empty section returns None."""
-        manager = StudentManager()
-        manager.add_section("empty", "Empty Section")
-        tools = ClassroomTools(manager)
+# Expected ids for a _make_manager section of each size used below
+_LARGE_SECTION_SIZE = 250
+_EXPECTED_IDS = {
+    n: frozenset(f"id{i}" for i in range(n)) for n in (*range(7), _LARGE_SECTION_SIZE)
+}
 
-        result = tools.spin_wheel("empty")
 
-        assert result is None
+@pytest.fixture(scope="module")
+def edge_case_tools():
+    """ClassroomTools over one manager holding every edge-case section, built once."""
+    manager = StudentManager()
+    manager.add_section("solo", "Solo Section")
+    manager.add_student("Lonely", "solo", "lone1")
+    manager.add_section("empty", "Empty Section")
+    return ClassroomTools(manager)
 
-    def test_spin_wheel_nonexistent_section(self, classroom_tools):
-        """Test spin_wheel with a non-existent section returns None."""
-        result = classroom_tools.spin_wheel("nonexistent")
 
-        assert result is None
+def _make_manager(names, section="sec"):
+    """Build a StudentManager with one section holding `names` as id0, id1, ..."""
+    manager = StudentManager()
+    manager.add_section(section, "Test Section")
+    manager.add_students(section, [(name, f"id{i}") for i, name in enumerate(names)])
+    return manager
 
 
-class TestCreateGroups:
-    def test_create_groups_even_distribution(self):
-        """Test creating groups where students divide evenly."""
-        manager = StudentManager()
-        manager.add_section("sec", "Test Section")
-        for i, name in enumerate(["A", "B", "C", "D", "E", "F"]):
-            manager.add_student(name, "sec", f"id{i}")
-        tools = ClassroomTools(manager)
+class TestSpinWheel:
+    def test_spin_wheel_returns_student_from_section(self, seeded_classroom_tools):
+        """Test that spin_wheel returns a student from the section."""
+        result = seeded_classroom_tools.spin_wheel("sec1")
+
+        assert isinstance(result, Student)
+        assert result.student_id == "s2"
+        assert result.name == "Bob"
+        assert result.section_id == "sec1"
+
+    @pytest.mark.parametrize(
+        "section_id, expected_name",
+        [("solo", "Lonely"), ("empty", None), ("nonexistent", None)],
+        ids=["single_student", "empty_section", "nonexistent_section"],
+    )
+    def test_spin_wheel_edge_cases(self, edge_case_tools, section_id, expected_name):
+        """Test spin_wheel on single-student, empty and missing sections."""
+        result = edge_case_tools.spin_wheel(section_id)
+
+        if expected_name is None:
+            assert result is None
+        else:
+            assert result.name == expected_name
 
-        groups = tools.create_groups("sec", group_size=2)
 
-        assert len(groups) == 3
-        for group in groups:
-            assert len(group) == 2
+class TestCreateGroups:
+    @pytest.mark.parametrize(
+        "names, group_size, expected_lengths",
+        [
+            (["A", "B", "C", "D", "E", "F"], 2, [2, 2, 2]),
+            (["A", "B", "C", "D", "E"], 2, [1, 2, 2]),
+            (["A", "B"], 5, [2]),
+            (["A", "B", "C", "D"], 2, [2, 2]),
+            (["A", "B", "C"], 2, [1, 2]),
+            ([], 3, []),
+        ],
+        ids=["even", "uneven", "size_larger_than_list", "pairs", "pairs_odd", "empty_section"],
+    )
+    def test_create_groups_distribution(self, names, group_size, expected_lengths):
+        """Test group sizes and membership across section sizes."""
+        tools = ClassroomTools(_make_manager(names))
+
+        groups = tools.create_groups("sec", group_size=group_size)
+
+        assert sorted(map(len, groups)) == expected_lengths
 
         # Verify all students are present
-        all_ids = [s["id"] for group in groups for s in group]
-        assert set(all_ids) == {f"id{i}" for i in range(6)}
-
-    def test_create_groups_uneven_distribution(self):
-        """Test creating groups where there is a remainder."""
-        manager = StudentManager()
-        manager.add_section("sec", "Test Section")
-        for i, name in enumerate(["A", "B", "C", "D", "E"]):
-            manager.add_student(name, "sec", f"id{i}")
-        tools = ClassroomTools(manager)
+        all_ids = set(map(attrgetter("student_id"), chain.from_iterable(groups)))
+        diff = all_ids.symmetric_difference(_EXPECTED_IDS[len(names)])
+        assert not diff, f"diff={diff}"
+
+    def test_create_groups_large_section(self):
+        """Test grouping a section large enough to take the numpy shuffle path."""
+        names = [f"Student {i}" for i in range(_LARGE_SECTION_SIZE)]
+        tools = ClassroomTools(_make_manager(names))
+
+        groups = tools.create_groups("sec", group_size=4)
+
+        assert len(groups) == 63
+        assert all(isinstance(g, list) for g in groups)
+        assert sum(map(len, groups)) == _LARGE_SECTION_SIZE
+        all_ids = set(map(attrgetter("student_id"), chain.from_iterable(groups)))
+        diff = all_ids.symmetric_difference(_EXPECTED_IDS[_LARGE_SECTION_SIZE])
+        assert not diff, f"diff={diff}"
+
+    @pytest.mark.parametrize("size", [1, 2, 5])
+    def test_create_groups_numpy_path_small_sections(self, monkeypatch, size):
+        """Test the numpy shuffle when the threshold is lowered to tiny sections."""
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(classroom_tools_module, "NUMPY_SHUFFLE_THRESHOLD", 1)
+        tools = ClassroomTools(_make_manager([f"Student {i}" for i in range(size)]))
 
         groups = tools.create_groups("sec", group_size=2)
 
-        assert len(groups) == 3  # [2, 2, 1]
-        lengths = sorted([len(g) for g in groups])
-        assert lengths == [1, 2, 2]
-
-    def test_create_groups_size_larger_than_list(self):
-        """Test creating a group size larger than the student list."""
-        manager = StudentManager()
-        manager.add_section("sec", "Test Section")
-        manager.add_student("A", "sec", "id1")
-        manager.add_student("B", "sec", "id2")
-        tools = ClassroomTools(manager)
+        all_ids = set(map(attrgetter("student_id"), chain.from_iterable(groups)))
+        diff = all_ids.symmetric_difference(_EXPECTED_IDS[size])
+        assert not diff, f"diff={diff}"
 
-        groups = tools.create_groups("sec", group_size=5)
+    @pytest.mark.parametrize("size", [10, 250], ids=["small", "large"])
+    def test_create_groups_reproducible_with_seeded_rng(self, size):
+        """Test that equally seeded tools produce identical groups."""
+        manager = _make_manager([f"Student {i}" for i in range(size)])
 
-        assert len(groups) == 1
-        assert len(groups[0]) == 2
+        first = ClassroomTools(manager, rng=random.Random(0)).create_groups("sec", group_size=3)
+        second = ClassroomTools(manager, rng=random.Random(0)).create_groups("sec", group_size=3)
 
-    def test_create_groups_empty_section(self):
-        """Test creating groups from an empty section."""
-        manager = StudentManager()
-        manager.add_section("empty", "Empty Section")
-        tools = ClassroomTools(manager)
+        assert first == second
 
-        groups = tools.create_groups("empty", group_size=3)
+    @pytest.mark.parametrize("bad_size", [0, -1, -100, -1000])
+    def test_create_groups_invalid_size(self, session_classroom_tools, bad_size):
+        """Test creating groups with a size below 1 raises ValueError."""
+        with pytest.raises(ValueError, match=_INVALID_SIZE_RE):
+            session_classroom_tools.create_groups("sec1", group_size=bad_size)
 
-        assert groups == []
-
-    def test_create_groups_invalid_size_zero(self, classroom_tools):
-        """Test creating groups with size 0 raises ValueError."""
-        with pytest.raises(ValueError):
-            classroom_tools.create_groups("sec1", group_size=0)
-
-    def test_create_groups_invalid_size_negative(self, classroom_tools):
-        """Test creating groups with negative size raises ValueError."""
-        with pytest.raises(ValueError):
-            classroom_tools.create_groups("sec1", group_size=-1)
-
-    def test_create_groups_nonexistent_section(self, classroom_tools):
+    def test_create_groups_nonexistent_section(self, session_classroom_tools):
         """Test creating groups from a non-existent section returns empty list."""
-        groups = classroom_tools.create_groups("nonexistent", group_size=2)
+        groups = session_classroom_tools.create_groups("nonexistent", group_size=2)
 
         assert groups == []
-
-    def test_create_groups_as_pairs(self):
-        """Test creating pairs (group_size=2) with even number of students."""
-        manager = StudentManager()
-        manager.add_section("sec", "Test Section")
-        for i, name in enumerate(["A", "B", "C", "D"]):
-            manager.add_student(name, "sec", f"id{i}")
-        tools = ClassroomTools(manager)
-
-        pairs = tools.create_groups("sec", group_size=2)
-
-        assert len(pairs) == 2
-        for pair in pairs:
-            assert len(pair) == 2
-
-    def test_create_groups_as_pairs_odd(self):
-        """Test creating pairs with odd number of students."""
-        manager = StudentManager()
-        manager.add_section("sec", "Test Section")
-        for i, name in enumerate(["A", "B", "C"]):
-            manager.add_student(name, "sec", f"id{i}")
-        tools = ClassroomTools(manager)
-
-        pairs = tools.create_groups("sec", group_size=2)
-
-        assert len(pairs) == 2
-        lengths = sorted([len(p) for p in pairs])
-        assert lengths == [1, 2]
@@ -1,5 +1,8 @@
+import pickle
+import re
+
 import pytest
-from src.student_manager import (
+from vijay_toolkit.student_manager import (
     StudentManager,
     Student,
     DuplicateStudentIdError,
@@ -8,6 +11,44 @@ from src.student_manager import (
 )
 
 
+# Expected error messages, compiled once for pytest.raises(match=...)
+_DUPLICATE_ID_RE = re.compile(r"already exist")
+_REPEATED_ID_RE = re.compile(r"repeat within the batch")
+_STUDENT_NOT_FOUND_RE = re.compile(r"Student ID \S+ not found")
+_SECTION_NOT_FOUND_RE = re.compile(r"Section ID \S+ not found")
+_MISSING_COLUMNS_RE = re.compile(r"must contain columns")
+_SHORT_ROW_RE = re.compile(r"CSV row 3 has fewer columns")
+
+_CSV_OK = """section_id,section_name,student_id,student_name
+sec1,Math 101,s1,Alice
+sec1,Math 101,s2,Bob
+sec2,English 101,s3,Charlie"""
+
+_CSV_DUP = """section_id,section_name,student_id,student_name
+sec1,Math 101,s1,Alice
+sec1,Math 101,s1,Alice Duplicate"""
+
+_CSV_BAD = """section_id,student_name
+sec1,Alice"""
+
+_CSV_SHORT_ROW = """section_id,section_name,student_id,student_name
+sec1,Math 101,s1,Alice
+sec1,Math 101,s2"""
+
+_ROWS_OK = [
+    {"section_id": "sec1", "section_name": "Math 101", "student_id": "s1", "student_name": "Alice"},
+    {"section_id": "sec1", "section_name": "Math 101", "student_id": "s2", "student_name": "Bob"},
+    {"section_id": "sec2", "section_name": "English 101", "student_id": "s3", "student_name": "Charlie"},
+]
+
+_ROWS_DUP = [
+    {"section_id": "sec1", "section_name": "Math 101", "student_id": "s1", "student_name": "Alice"},
+    {"section_id": "sec1", "section_name": "Math 101", "student_id": "s1", "student_name": "Alice Duplicate"},
+]
+
+_ROWS_BAD = [{"section_id": "sec1", "student_name": "Alice"}]
+
+
 @pytest.fixture
 def manager():
     """Fixture to provide a fresh StudentManager instance for each test."""
@@ -15,68 +56,107 @@ def manager():
 
 
 @pytest.fixture
-def populated_manager():
-    """Fixture with some pre-loaded data."""
-    manager = StudentManager()
-    manager.add_section("A", "Section A")
-    manager.add_section("B", "Section B")
-    manager.add_student("Alice", "A", "alice1")
-    manager.add_student("Bob", "A", "bob1")
-    manager.add_student("Charlie", "B", "charlie1")
-    return manager
+def populated_manager(populated_template):
+    """Fixture with some pre-loaded data, fresh for each test so it may be mutated."""
+    return pickle.loads(populated_template)
+
+
+@pytest.fixture(scope="session")
+def readonly_populated_manager(populated_template):
+    """Pre-loaded data shared by tests that only read. Never mutate it."""
+    return pickle.loads(populated_template)
 
 
 class TestAddSection:
-    def test_add_section_success(self, manager):
-        """Test adding a new section."""
-        section = manager.add_section("sec1", "Section 1")
+    def test_add_section_invariants(self, subtests):
+        """Test creating, renaming and looking up sections."""
+        for section_id, first_name, second_name in [
+            ("sec1", "Section 1", "Renamed Section 1"),
+            ("sec2", "Original Name", "Updated Name"),
+        ]:
+            with subtests.test(section_id=section_id):
+                manager = StudentManager()
+                section = manager.add_section(section_id, first_name)
 
-        assert section.section_id == "sec1"
-        assert section.name == "Section 1"
-        assert manager.get_section("sec1") is not None
+                assert section.section_id == section_id
+                assert section.name == first_name
+                assert manager.has_section(section_id)
 
-    def test_add_section_update_existing(self, manager):
-        """Test that adding a section with same ID updates the name."""
-        manager.add_section("sec1", "Original Name")
-        manager.add_section("sec1", "Updated Name")
+                manager.add_section(section_id, second_name)
+                assert manager.get_section(section_id).name == second_name
 
-        section = manager.get_section("sec1")
-        assert section.name == "Updated Name"
+        with subtests.test(section_id="nonexistent"):
+            manager = StudentManager()
+            assert not manager.has_section("nonexistent")
+            assert manager.get_section("nonexistent") is None
 
 
 class TestAddStudent:
-    def test_add_student_success(self, manager):
-        """Test adding a student to a section."""
+    def test_add_student_invariants(self, subtests):
+        """Test adding students with explicit and generated IDs and sections."""
+        for name, section_id, student_id in [
+            ("Alice", "A", "alice1"),
+            ("Bob", "NewSection", "bob1"),
+            ("Carol", "A", None),
+        ]:
+            with subtests.test(name=name):
+                manager = StudentManager()
+                manager.add_section("A", "Section A")
+                student = manager.add_student(name, section_id, student_id)
+
+                assert isinstance(student, Student)
+                assert student.name == name
+                assert student.section_id == section_id
+                assert manager.get_section(section_id) is not None
+                if student_id is None:
+                    assert student.student_id
+                else:
+                    assert student.student_id == student_id
+
+    def test_add_student_auto_generated_ids_are_unique(self, manager):
+        """Test that consecutive auto-generated IDs do not collide."""
+        ids = {manager.add_student(f"Student {i}", "A").student_id for i in range(50)}
+
+        assert len(ids) == 50
+
+    def test_add_duplicate_student_id_raises(self, manager):
+        """Test that adding a student with duplicate ID raises error."""
         manager.add_section("A", "Section A")
-        student = manager.add_student("Alice", "A", "alice1")
+        manager.add_student("Alice", "A", "same_id")
 
-        assert isinstance(student, Student)
-        assert student.name == "Alice"
-        assert student.section_id == "A"
-        assert student.student_id == "alice1"
+        with pytest.raises(DuplicateStudentIdError, match=_DUPLICATE_ID_RE):
+            manager.add_student("Bob", "A", "same_id")
 
-    def test_add_student_auto_creates_section(self, manager):
-        """Test that adding a student to non-existent section creates it."""
-        student = manager.add_student("Alice", "NewSection", "alice1")
 
-        assert student.section_id == "NewSection"
-        assert manager.get_section("NewSection") is not None
+class TestAddStudents:
+    def test_add_students_success(self, manager):
+        """Test adding a batch of students to one section."""
+        students = manager.add_students("A", [("Alice", "alice1"), ("Bob", "bob1")])
 
-    def test_add_student_auto_generates_id(self, manager):
-        """Test that student_id is auto-generated if not provided."""
-        manager.add_section("A", "Section A")
-        student = manager.add_student("Alice", "A")
+        assert [s.student_id for s in students] == ["alice1", "bob1"]
+        assert manager.get_section("A") is not None
+        assert {s.name for s in manager.get_students_by_section("A")} == {"Alice", "Bob"}
 
-        assert student.student_id is not None
-        assert len(student.student_id) > 0
+    def test_add_students_keeps_roster_consistent(self, populated_manager):
+        """Test that batch-added students can be removed individually."""
+        populated_manager.add_students("A", [("Dana", "dana1"), ("Eve", "eve1")])
+        populated_manager.remove_student("dana1")
+        populated_manager.remove_student("alice1")
 
-    def test_add_duplicate_student_id_raises(self, manager):
-        """Test that adding a student with duplicate ID raises error."""
-        manager.add_section("A", "Section A")
-        manager.add_student("Alice", "A", "same_id")
+        ids = {s.student_id for s in populated_manager.get_students_by_section("A")}
+        assert ids == {"bob1", "eve1"}
 
-        with pytest.raises(DuplicateStudentIdError):
-            manager.add_student("Bob", "A", "same_id")
+    def test_add_students_existing_id_raises(self, populated_manager):
+        """Test that a batch with an existing ID adds nobody."""
+        with pytest.raises(DuplicateStudentIdError, match=_DUPLICATE_ID_RE):
+            populated_manager.add_students("B", [("Dana", "dana1"), ("Alice", "alice1")])
+
+        assert len(populated_manager.get_students_by_section("B")) == 1
+
+    def test_add_students_repeated_id_raises(self, manager):
+        """Test that a batch repeating an ID raises error."""
+        with pytest.raises(DuplicateStudentIdError, match=_REPEATED_ID_RE):
+            manager.add_students("A", [("Alice", "same_id"), ("Bob", "same_id")])
 
 
 class TestRemoveStudent:
@@ -84,14 +164,23 @@ class TestRemoveStudent:
         """Test removing an existing student."""
         populated_manager.remove_student("alice1")
 
-        students = populated_manager.get_students_by_section("A")
-        student_ids = [s.student_id for s in students]
-        assert "alice1" not in student_ids
+        assert "alice1" not in populated_manager.get_student_ids_by_section("A")
 
-    def test_remove_student_non_existent_raises(self, populated_manager):
+    def test_remove_student_keeps_roster_consistent(self, populated_manager):
+        """Test that removals in any order leave the remaining roster intact."""
+        populated_manager.add_student("Dana", "A", "dana1")
+        populated_manager.remove_student("alice1")
+        populated_manager.remove_student("dana1")
+        populated_manager.update_student("bob1", section_id="B")
+
+        assert populated_manager.get_students_by_section("A") == []
+        ids = {s.student_id for s in populated_manager.get_students_by_section("B")}
+        assert ids == {"bob1", "charlie1"}
+
+    def test_remove_student_non_existent_raises(self, readonly_populated_manager):
         """Test removing a non-existent student raises error."""
-        with pytest.raises(StudentNotFoundError):
-            populated_manager.remove_student("nonexistent")
+        with pytest.raises(StudentNotFoundError, match=_STUDENT_NOT_FOUND_RE):
+            readonly_populated_manager.remove_student("nonexistent")
 
 
 class TestUpdateStudent:
@@ -102,47 +191,104 @@ class TestUpdateStudent:
         assert updated.name == "Alicia"
         assert updated.student_id == "alice1"
 
+    def test_update_student_refreshes_cached_response(self, populated_manager):
+        """Test that the prebuilt response dict follows name and section changes."""
+        updated = populated_manager.update_student("alice1", name="Alicia", section_id="B")
+
+        assert updated.response_dict == {"id": "alice1", "name": "Alicia", "section_id": "B"}
+
     def test_update_student_section(self, populated_manager):
         """Test moving a student to a different section."""
         updated = populated_manager.update_student("alice1", section_id="B")
 
         assert updated.section_id == "B"
 
-        # Verify student is in new section
-        section_b_students = populated_manager.get_students_by_section("B")
-        assert any(s.student_id == "alice1" for s in section_b_students)
-
-        # Verify student is not in old section
-        section_a_students = populated_manager.get_students_by_section("A")
-        assert not any(s.student_id == "alice1" for s in section_a_students)
+        # Verify student moved from the old section to the new one
+        b_ids = populated_manager.get_student_ids_by_section("B")
+        a_ids = populated_manager.get_student_ids_by_section("A")
+        assert "alice1" in b_ids and "alice1" not in a_ids
 
     def test_update_student_non_existent_raises(self, populated_manager):
         """Test updating a non-existent student raises error."""
-        with pytest.raises(StudentNotFoundError):
+        with pytest.raises(StudentNotFoundError, match=_STUDENT_NOT_FOUND_RE):
             populated_manager.update_student("nonexistent", name="New Name")
 
     def test_update_student_to_non_existent_section_raises(self, populated_manager):
         """Test moving student to non-existent section raises error."""
-        with pytest.raises(SectionNotFoundError):
+        with pytest.raises(SectionNotFoundError, match=_SECTION_NOT_FOUND_RE):
             populated_manager.update_student("alice1", section_id="NonExistent")
 
+    def test_update_student_failed_move_leaves_student_unchanged(self, populated_manager):
+        """Test that a rejected move does not apply the accompanying rename."""
+        with pytest.raises(SectionNotFoundError, match=_SECTION_NOT_FOUND_RE):
+            populated_manager.update_student("alice1", name="Alicia", section_id="NonExistent")
+
+        student = populated_manager.get_roster_snapshot("A")[0]
+        assert student.name == "Alice"
+        assert student.response_dict == {"id": "alice1", "name": "Alice", "section_id": "A"}
+
+
+class TestGetSectionVersion:
+    def test_section_version_changes_with_roster(self, populated_manager):
+        """Test that adds, renames and moves each change the section version."""
+        seen = {populated_manager.get_section_version("A")}
+
+        populated_manager.add_student("Dana", "A", "dana1")
+        seen.add(populated_manager.get_section_version("A"))
+        populated_manager.update_student("dana1", name="Dane")
+        seen.add(populated_manager.get_section_version("A"))
+        populated_manager.update_student("dana1", section_id="B")
+        seen.add(populated_manager.get_section_version("A"))
+
+        assert len(seen) == 4
+
+    def test_section_version_non_existent_raises(self, manager):
+        """Test asking for the version of a missing section raises error."""
+        with pytest.raises(SectionNotFoundError, match=_SECTION_NOT_FOUND_RE):
+            manager.get_section_version("nonexistent")
+
 
 class TestGetStudentsBySection:
-    def test_get_students_by_section_valid(self, populated_manager):
+    def test_get_students_by_section_valid(self, readonly_populated_manager):
         """Test retrieving students from a valid section."""
-        students = populated_manager.get_students_by_section("B")
+        students = readonly_populated_manager.get_students_by_section("B")
 
         assert len(students) == 1
         assert students[0].name == "Charlie"
 
-    def test_get_students_by_section_multiple(self, populated_manager):
+    def test_get_students_by_section_multiple(self, readonly_populated_manager):
         """Test retrieving multiple students from a section."""
-        students = populated_manager.get_students_by_section("A")
+        students = readonly_populated_manager.get_students_by_section("A")
 
         assert len(students) == 2
         names = {s.name for s in students}
         assert names == {"Alice", "Bob"}
 
+    def test_get_students_by_section_reflects_new_student(self, populated_manager):
+        """Test that a cached roster is rebuilt after the section changes."""
+        populated_manager.get_students_by_section("B")
+        populated_manager.add_student("Dana", "B", "dana1")
+
+        students = populated_manager.get_students_by_section("B")
+        assert {s.student_id for s in students} == {"charlie1", "dana1"}
+
+    def test_get_students_by_section_returns_copy(self, populated_manager):
+        """Test that mutating the returned list does not affect the roster."""
+        students = populated_manager.get_students_by_section("A")
+        students.clear()
+
+        assert len(populated_manager.get_students_by_section("A")) == 2
+
+    def test_get_roster_snapshot_reused_until_change(self, populated_manager):
+        """Test that the roster snapshot is shared until the section changes."""
+        snapshot = populated_manager.get_roster_snapshot("A")
+
+        assert isinstance(snapshot, tuple)
+        assert populated_manager.get_roster_snapshot("A") is snapshot
+
+        populated_manager.remove_student("bob1")
+        assert [s.student_id for s in populated_manager.get_roster_snapshot("A")] == ["alice1"]
+
     def test_get_students_by_section_empty(self, manager):
         """Test retrieving students from an empty section."""
         manager.add_section("empty", "Empty Section")
@@ -152,40 +298,98 @@ class TestGetStudentsBySection:
 
     def test_get_students_by_section_non_existent_raises(self, manager):
         """Test retrieving from non-existent section raises error."""
-        with pytest.raises(SectionNotFoundError):
+        with pytest.raises(SectionNotFoundError, match=_SECTION_NOT_FOUND_RE):
             manager.get_students_by_section("nonexistent")
 
 
-class TestImportRosterFromCSV:
-    def test_import_roster_success(self, manager):
-        """Test importing students from CSV."""
-        csv_data = """section_id,section_name,student_id,student_name
-sec1,Math 101,s1,Alice
-sec1,Math 101,s2,Bob
-sec2,English 101,s3,Charlie"""
+class TestGetStudentIdsBySection:
+    def test_get_student_ids_by_section_valid(self, readonly_populated_manager):
+        """Test retrieving the student IDs of a section."""
+        ids = readonly_populated_manager.get_student_ids_by_section("A")
+
+        assert ids == frozenset({"alice1", "bob1"})
 
-        stats = manager.import_roster_from_csv(csv_data)
+    def test_get_student_ids_by_section_reflects_removal(self, populated_manager):
+        """Test that cached IDs are rebuilt after the section changes."""
+        populated_manager.get_student_ids_by_section("A")
+        populated_manager.remove_student("alice1")
 
-        assert stats["students_added"] == 3
-        assert stats["sections_seen"] == 2
+        assert populated_manager.get_student_ids_by_section("A") == frozenset({"bob1"})
 
-        math_students = manager.get_students_by_section("sec1")
-        assert len(math_students) == 2
+    def test_get_student_ids_by_section_non_existent_raises(self, manager):
+        """Test retrieving IDs from non-existent section raises error."""
+        with pytest.raises(SectionNotFoundError, match=_SECTION_NOT_FOUND_RE):
+            manager.get_student_ids_by_section("nonexistent")
 
-    def test_import_roster_skips_duplicates(self, manager):
-        """Test that duplicate student IDs are skipped during import."""
-        csv_data = """section_id,section_name,student_id,student_name
-sec1,Math 101,s1,Alice
-sec1,Math 101,s1,Alice Duplicate"""
 
-        stats = manager.import_roster_from_csv(csv_data)
+class TestRandomStudentInSection:
+    def test_random_student_in_section_valid(self, readonly_populated_manager):
+        """Test picking a random student from a populated section."""
+        student = readonly_populated_manager.random_student_in_section("A")
+
+        assert student.student_id in {"alice1", "bob1"}
 
-        assert stats["students_added"] == 1
+    def test_random_student_in_section_empty(self, manager):
+        """Test picking from an empty section returns None."""
+        manager.add_section("empty", "Empty Section")
+
+        assert manager.random_student_in_section("empty") is None
+
+    def test_random_student_in_section_non_existent_raises(self, manager):
+        """Test picking from a non-existent section raises error."""
+        with pytest.raises(SectionNotFoundError, match=_SECTION_NOT_FOUND_RE):
+            manager.random_student_in_section("nonexistent")
+
+
+class TestImportRosterFromCSV:
+    @pytest.mark.parametrize(
+        "csv_text, expected_added, expected_sections, expected_sec1_size",
+        [(_CSV_OK, 3, 2, 2), (_CSV_DUP, 1, 1, 1)],
+        ids=["success", "skips_duplicates"],
+    )
+    def test_import_roster(
+        self, manager, csv_text, expected_added, expected_sections, expected_sec1_size
+    ):
+        """Test importing students from CSV, skipping duplicate student IDs."""
+        stats = manager.import_roster_from_csv(csv_text)
+
+        assert stats["students_added"] == expected_added
+        assert stats["sections_seen"] == expected_sections
+
+        math_students = manager.get_students_by_section("sec1")
+        assert len(math_students) == expected_sec1_size
 
     def test_import_roster_missing_columns_raises(self, manager):
         """Test that CSV with missing columns raises error."""
-        csv_data = """section_id,student_name
-sec1,Alice"""
+        with pytest.raises(ValueError, match=_MISSING_COLUMNS_RE):
+            manager.import_roster_from_csv(_CSV_BAD)
+
+    def test_import_roster_short_row_raises(self, manager):
+        """Test that a row with fewer columns than the header raises ValueError."""
+        with pytest.raises(ValueError, match=_SHORT_ROW_RE):
+            manager.import_roster_from_csv(_CSV_SHORT_ROW)
+
+        # Rows before the short one stay imported
+        assert manager.get_student_ids_by_section("sec1") == {"s1"}
+
+
+class TestImportRoster:
+    @pytest.mark.parametrize(
+        "rows, expected_added, expected_sections, expected_sec1_size",
+        [(_ROWS_OK, 3, 2, 2), (_ROWS_DUP, 1, 1, 1)],
+        ids=["success", "skips_duplicates"],
+    )
+    def test_import_roster(
+        self, manager, rows, expected_added, expected_sections, expected_sec1_size
+    ):
+        """Test importing pre-parsed rows, skipping duplicate student IDs."""
+        stats = manager.import_roster(rows)
+
+        assert stats["students_added"] == expected_added
+        assert stats["sections_seen"] == expected_sections
+        assert len(manager.get_students_by_section("sec1")) == expected_sec1_size
 
-        with pytest.raises(ValueError):
-            manager.import_roster_from_csv(csv_data)
+    def test_import_roster_missing_columns_raises(self, manager):
+        """Test that rows with missing columns raise error."""
+        with pytest.raises(ValueError, match=_MISSING_COLUMNS_RE):
+            manager.import_roster(_ROWS_BAD)